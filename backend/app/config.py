@@ -3,122 +3,195 @@ Configuration settings for Primary Cell Assessment API
 Loads environment variables and provides application settings
 """
 
-from pydantic_settings import BaseSettings
-from typing import List
+from dataclasses import dataclass
+from typing import List, Tuple
 import os
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+
+# Origins allowed in every environment; CORS_ORIGINS adds to these
+DEFAULT_CORS_ORIGINS: Tuple[str, ...] = (
+    "http://localhost:5173",  # Vite dev server
+    "http://localhost:3000",  # Alternative dev port
+    "http://localhost:4173",  # Vite preview server
+    "https://primarycell.com",
+    "https://www.primarycell.com",
+    "https://cell-quiz-backup.preview.emergentagent.com",  # Emergent preview
+)
+
+
+def _env_str(name: str, default: str = "") -> str:
+    """Read a string environment variable."""
+    return os.environ.get(name, default)
+
+
+def _env_bool(name: str, default: str) -> bool:
+    """Read a boolean environment variable ("true" enables it)."""
+    return os.environ.get(name, default).lower() == "true"
+
+
+def _env_int(name: str, default: str) -> int:
+    """Read an integer environment variable."""
+    return int(os.environ.get(name, default))
+
+
+def _env_list(name: str) -> Tuple[str, ...]:
+    """Read a comma-separated environment variable, skipping blank items."""
+    return tuple(item.strip() for item in os.environ.get(name, "").split(",") if item.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
     # ========================================================================
     # APPLICATION SETTINGS
     # ========================================================================
-    APP_NAME: str = "Primary Cell Assessment API"
-    VERSION: str = "1.0.0"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    APP_NAME: str
+    VERSION: str
+    ENVIRONMENT: str
 
     # ========================================================================
     # DATABASE SETTINGS
     # ========================================================================
-    MONGODB_URI: str = os.getenv(
-        "MONGODB_URI",
-        "mongodb://localhost:27017"
-    )
-    MONGODB_DATABASE: str = os.getenv("MONGODB_DATABASE", "primary_cell_assessment")
+    MONGODB_URI: str
+    MONGODB_DATABASE: str
 
     # ========================================================================
     # CORS SETTINGS
     # ========================================================================
-    CORS_ORIGINS: List[str] = [
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:3000",  # Alternative dev port
-        "http://localhost:4173",  # Vite preview server
-        "https://primarycell.com",
-        "https://www.primarycell.com",
-        "https://cell-quiz-backup.preview.emergentagent.com",  # Emergent preview
-        "https://cell-quiz-backup.preview.emergentagent.com",  # Custom preview domain
-    ]
-
-    # Add additional CORS origins from environment
-    @property
-    def cors_origins(self) -> List[str]:
-        additional_origins = os.getenv("CORS_ORIGINS", "")
-        if additional_origins:
-            return self.CORS_ORIGINS + additional_origins.split(",")
-        return self.CORS_ORIGINS
+    CORS_ORIGINS: Tuple[str, ...]
 
     # ========================================================================
     # EMAIL SETTINGS
     # ========================================================================
-    EMAIL_PROVIDER: str = os.getenv("EMAIL_PROVIDER", "sendgrid")
+    EMAIL_PROVIDER: str
 
     # SendGrid
-    SENDGRID_API_KEY: str = os.getenv("SENDGRID_API_KEY", "")
-    SENDGRID_FROM_EMAIL: str = os.getenv("SENDGRID_FROM_EMAIL", "noreply@primarycell.com")
-    SENDGRID_FROM_NAME: str = os.getenv("SENDGRID_FROM_NAME", "Primary Cell Assessment")
+    SENDGRID_API_KEY: str
+    SENDGRID_FROM_EMAIL: str
+    SENDGRID_FROM_NAME: str
 
     # AWS SES (alternative)
-    AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
-    AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-    AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
+    AWS_ACCESS_KEY_ID: str
+    AWS_SECRET_ACCESS_KEY: str
+    AWS_REGION: str
 
     # Email templates
-    RESULTS_EMAIL_TEMPLATE_ID: str = os.getenv("RESULTS_EMAIL_TEMPLATE_ID", "")
+    RESULTS_EMAIL_TEMPLATE_ID: str
 
     # ========================================================================
     # RATE LIMITING
     # ========================================================================
-    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_ENABLED: bool
 
     # Rate limits per endpoint (requests per 15 minutes)
-    RATE_LIMIT_SUBMIT_ASSESSMENT: int = int(os.getenv("RATE_LIMIT_SUBMIT_ASSESSMENT", "5"))
-    RATE_LIMIT_SAVE_PROGRESS: int = int(os.getenv("RATE_LIMIT_SAVE_PROGRESS", "30"))
-    RATE_LIMIT_SEND_EMAIL: int = int(os.getenv("RATE_LIMIT_SEND_EMAIL", "3"))
-    RATE_LIMIT_HEALTH: int = int(os.getenv("RATE_LIMIT_HEALTH", "100"))
+    RATE_LIMIT_SUBMIT_ASSESSMENT: int
+    RATE_LIMIT_SAVE_PROGRESS: int
+    RATE_LIMIT_SEND_EMAIL: int
+    RATE_LIMIT_QUIZ_SUBMIT: int
 
     # ========================================================================
     # SECURITY SETTINGS
     # ========================================================================
     # API Keys for programmatic access (optional)
-    API_KEYS: List[str] = os.getenv("API_KEYS", "").split(",") if os.getenv("API_KEYS") else []
+    API_KEYS: Tuple[str, ...]
 
     # Maximum request body size (1MB)
-    MAX_REQUEST_SIZE: int = int(os.getenv("MAX_REQUEST_SIZE", "1048576"))
+    MAX_REQUEST_SIZE: int
 
     # ========================================================================
     # LOGGING SETTINGS
     # ========================================================================
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str
+
+    # Local JSON-lines audit log of submissions (empty disables it)
+    AUDIT_LOG_PATH: str
 
     # Sentry for error tracking (optional)
-    SENTRY_DSN: str = os.getenv("SENTRY_DSN", "")
-    SENTRY_ENVIRONMENT: str = os.getenv("SENTRY_ENVIRONMENT", ENVIRONMENT)
+    SENTRY_DSN: str
+    SENTRY_ENVIRONMENT: str
 
     # ========================================================================
     # FEATURE FLAGS
     # ========================================================================
-    ENABLE_EMAIL_RESULTS: bool = os.getenv("ENABLE_EMAIL_RESULTS", "true").lower() == "true"
-    ENABLE_AUTO_SAVE: bool = os.getenv("ENABLE_AUTO_SAVE", "true").lower() == "true"
+    ENABLE_EMAIL_RESULTS: bool
+    ENABLE_AUTO_SAVE: bool
 
     # ========================================================================
     # CRM INTEGRATION (Optional)
     # ========================================================================
-    CRM_ENABLED: bool = os.getenv("CRM_ENABLED", "false").lower() == "true"
-    CRM_PROVIDER: str = os.getenv("CRM_PROVIDER", "")  # e.g., 'salesforce', 'hubspot'
-    CRM_API_KEY: str = os.getenv("CRM_API_KEY", "")
-    CRM_API_URL: str = os.getenv("CRM_API_URL", "")
+    CRM_ENABLED: bool
+    CRM_PROVIDER: str  # e.g., 'salesforce', 'hubspot'
+    CRM_API_KEY: str
+    CRM_API_URL: str
 
     # ========================================================================
     # REDIS SETTINGS (for rate limiting and caching)
     # ========================================================================
-    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
-    REDIS_ENABLED: bool = os.getenv("REDIS_ENABLED", "false").lower() == "true"
+    REDIS_URL: str
+    REDIS_ENABLED: bool
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @property
+    def cors_origins(self) -> List[str]:
+        """CORS origins as a list, for APIs that expect one."""
+        return list(self.CORS_ORIGINS)
+
+    @classmethod
+    def load(cls, env_file: str = ".env") -> "Settings":
+        """
+        Build settings from the environment.
+
+        Variables already set in the environment take precedence over
+        values from `env_file`.
+
+        Args:
+            env_file: Path of the optional dotenv file
+
+        Returns:
+            Settings: Immutable settings instance
+        """
+        load_dotenv(env_file, override=False)
+
+        environment = _env_str("ENVIRONMENT", "development")
+
+        return cls(
+            APP_NAME=_env_str("APP_NAME", "Primary Cell Assessment API"),
+            VERSION=_env_str("VERSION", "1.0.0"),
+            ENVIRONMENT=environment,
+            MONGODB_URI=_env_str("MONGODB_URI", "mongodb://localhost:27017"),
+            MONGODB_DATABASE=_env_str("MONGODB_DATABASE", "primary_cell_assessment"),
+            CORS_ORIGINS=tuple(dict.fromkeys(DEFAULT_CORS_ORIGINS + _env_list("CORS_ORIGINS"))),
+            EMAIL_PROVIDER=_env_str("EMAIL_PROVIDER", "sendgrid"),
+            SENDGRID_API_KEY=_env_str("SENDGRID_API_KEY"),
+            SENDGRID_FROM_EMAIL=_env_str("SENDGRID_FROM_EMAIL", "noreply@primarycell.com"),
+            SENDGRID_FROM_NAME=_env_str("SENDGRID_FROM_NAME", "Primary Cell Assessment"),
+            AWS_ACCESS_KEY_ID=_env_str("AWS_ACCESS_KEY_ID"),
+            AWS_SECRET_ACCESS_KEY=_env_str("AWS_SECRET_ACCESS_KEY"),
+            AWS_REGION=_env_str("AWS_REGION", "us-east-1"),
+            RESULTS_EMAIL_TEMPLATE_ID=_env_str("RESULTS_EMAIL_TEMPLATE_ID"),
+            RATE_LIMIT_ENABLED=_env_bool("RATE_LIMIT_ENABLED", "true"),
+            RATE_LIMIT_SUBMIT_ASSESSMENT=_env_int("RATE_LIMIT_SUBMIT_ASSESSMENT", "5"),
+            RATE_LIMIT_SAVE_PROGRESS=_env_int("RATE_LIMIT_SAVE_PROGRESS", "30"),
+            RATE_LIMIT_SEND_EMAIL=_env_int("RATE_LIMIT_SEND_EMAIL", "3"),
+            RATE_LIMIT_QUIZ_SUBMIT=_env_int("RATE_LIMIT_QUIZ_SUBMIT", "10"),
+            API_KEYS=_env_list("API_KEYS"),
+            MAX_REQUEST_SIZE=_env_int("MAX_REQUEST_SIZE", "1048576"),
+            LOG_LEVEL=_env_str("LOG_LEVEL", "INFO"),
+            AUDIT_LOG_PATH=_env_str("AUDIT_LOG_PATH"),
+            SENTRY_DSN=_env_str("SENTRY_DSN"),
+            SENTRY_ENVIRONMENT=_env_str("SENTRY_ENVIRONMENT", environment),
+            ENABLE_EMAIL_RESULTS=_env_bool("ENABLE_EMAIL_RESULTS", "true"),
+            ENABLE_AUTO_SAVE=_env_bool("ENABLE_AUTO_SAVE", "true"),
+            CRM_ENABLED=_env_bool("CRM_ENABLED", "false"),
+            CRM_PROVIDER=_env_str("CRM_PROVIDER"),
+            CRM_API_KEY=_env_str("CRM_API_KEY"),
+            CRM_API_URL=_env_str("CRM_API_URL"),
+            REDIS_URL=_env_str("REDIS_URL", "redis://localhost:6379"),
+            REDIS_ENABLED=_env_bool("REDIS_ENABLED", "false"),
+        )
 
 
 # Global settings instance
-settings = Settings()
+settings = Settings.load()
@@ -0,0 +1,89 @@
+"""
+Response compression middleware
+Gzips large responses on selected routes only
+"""
+
+from typing import Tuple
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class SizedGZipMiddleware:
+    """
+    Pure ASGI gzip middleware for routes known to return large bodies.
+
+    Requests outside `path_prefixes`, or from clients that don't accept
+    gzip, are passed straight to the app with no wrapping. Otherwise a
+    single-message body of at least `minimum_size` bytes is compressed in
+    one call at a fast compression level. Streamed or already encoded
+    responses are sent unchanged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Tuple[str, ...],
+        minimum_size: int = 4096,
+        compresslevel: int = 1,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
+            path_prefixes: Request path prefixes eligible for compression
+            minimum_size: Smallest body (bytes) worth compressing
+            compresslevel: gzip level, 1 (fastest) to 9 (smallest)
+        """
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        if "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message
+
+            # Hold the headers until the first body chunk shows its size
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or not start_message:
+                await send(message)
+                return
+
+            start, start_message = start_message, {}
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start["headers"]))
+
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            body = gzip.compress(body, compresslevel=self.compresslevel)
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
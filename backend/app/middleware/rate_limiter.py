@@ -1,127 +1,188 @@
 """
-Rate limiting middleware to prevent API abuse
+Rate limiting dependencies to prevent API abuse
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from typing import Awaitable, Callable, Dict, Tuple
+import logging
 import time
 
+from fastapi import Request, Response
+
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Raised by a rate limit dependency when a client exceeds its limit."""
+
+    def __init__(self, limit: int, window_seconds: int, retry_after: int, headers: Dict[str, str]):
+        super().__init__("Rate limit exceeded")
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.retry_after = retry_after
+        self.headers = headers
+
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter.
-    For production, use Redis-based rate limiting.
+    Simple in-memory fixed-window rate limiter.
+    Limits are per worker process; enable Redis to share them.
     """
 
     def __init__(self):
         """Initialize rate limiter with storage."""
-        self.requests: Dict[str, list] = {}
-        self.window_seconds = 900  # 15 minutes
+        # Format: {key: (request_count, window_reset_timestamp)}
+        self.windows: Dict[str, Tuple[int, float]] = {}
 
-    def check_rate_limit(self, ip: str, endpoint: str) -> Tuple[bool, int]:
+    async def hit(self, key: str, window_seconds: int) -> Tuple[int, int]:
         """
-        Check if request is within rate limit.
+        Count a request against the current window for a key.
 
         Args:
-            ip: Client IP address
-            endpoint: API endpoint path
+            key: Limit key (endpoint key and client IP)
+            window_seconds: Window length in seconds
 
         Returns:
-            Tuple[bool, int]: (is_allowed, retry_after_seconds)
+            Tuple[int, int]: (requests_in_window, milliseconds_until_reset)
         """
-        if not settings.RATE_LIMIT_ENABLED:
-            return True, 0
+        now = time.time()
+        count, reset_at = self.windows.get(key, (0, 0.0))
 
-        # Get rate limit for endpoint
-        limit = self.get_limit(endpoint)
+        # Start a new window once the previous one has expired
+        if reset_at <= now:
+            count, reset_at = 0, now + window_seconds
 
-        # Create key for tracking
-        key = f"{ip}:{endpoint}"
+        count += 1
+        self.windows[key] = (count, reset_at)
 
-        # Get current timestamp
-        now = time.time()
-        window_start = now - self.window_seconds
+        return count, int((reset_at - now) * 1000)
 
-        # Initialize or clean old requests
-        if key not in self.requests:
-            self.requests[key] = []
 
-        # Remove requests outside window
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if req_time > window_start
-        ]
+class RedisRateLimiter:
+    """
+    Redis-backed fixed-window rate limiter.
+    Limits are shared by every worker connected to the same Redis.
+    """
 
-        # Check if limit exceeded
-        if len(self.requests[key]) >= limit:
-            oldest_request = min(self.requests[key])
-            retry_after = int(oldest_request + self.window_seconds - now)
-            return False, max(retry_after, 0)
+    # INCR and PEXPIRE run atomically in one round trip
+    SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('PTTL', KEYS[1])}
+"""
 
-        # Add current request
-        self.requests[key].append(now)
+    def __init__(self, url: str):
+        """Initialize rate limiter with a Redis connection pool."""
+        from redis import asyncio as redis
 
-        return True, 0
+        self.client = redis.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
 
-    def get_limit(self, endpoint: str) -> int:
+    async def hit(self, key: str, window_seconds: int) -> Tuple[int, int]:
         """
-        Get rate limit for endpoint.
+        Count a request against the current window for a key.
 
         Args:
-            endpoint: API endpoint path
+            key: Limit key (endpoint key and client IP)
+            window_seconds: Window length in seconds
 
         Returns:
-            int: Maximum requests per window
-        """
-        if "/api/assessment/submit" in endpoint:
-            return settings.RATE_LIMIT_SUBMIT_ASSESSMENT
-        elif "/api/assessment/save-progress" in endpoint:
-            return settings.RATE_LIMIT_SAVE_PROGRESS
-        elif "/api/email/send-results" in endpoint:
-            return settings.RATE_LIMIT_SEND_EMAIL
-        elif "/health" in endpoint:
-            return settings.RATE_LIMIT_HEALTH
-        else:
-            return 60  # Default: 60 requests per 15 minutes
-
-    def get_remaining(self, ip: str, endpoint: str) -> int:
+            Tuple[int, int]: (requests_in_window, milliseconds_until_reset)
         """
-        Get remaining requests in current window.
+        count, ttl_ms = await self.script(
+            keys=[f"rate_limit:{key}"],
+            args=[window_seconds * 1000],
+        )
+        return int(count), max(int(ttl_ms), 0)
+
+
+def rate_limit(
+    endpoint_key: str,
+    limit: int,
+    window_seconds: int = 900,
+) -> Callable[[Request, Response], Awaitable[Dict[str, str]]]:
+    """
+    Build a dependency enforcing a per-IP rate limit on a route.
 
-        Args:
-            ip: Client IP address
-            endpoint: API endpoint path
+    The dependency sets the X-RateLimit-* headers on the response and also
+    returns them, for endpoints that build their own Response object. They
+    are kept on `request.state` as well, so the app's exception handlers
+    can add them to error responses (see `get_rate_limit_headers`).
 
-        Returns:
-            int: Remaining requests
-        """
-        key = f"{ip}:{endpoint}"
-        limit = self.get_limit(endpoint)
+    The check is also exposed as the dependency's `before_body` hook, which
+    ORJSONRoute runs before FastAPI parses the body, so requests with a
+    malformed body are still counted. Each request is counted once.
 
-        if key not in self.requests:
-            return limit
+    Args:
+        endpoint_key: Name of the limit, shared by routes that share a budget
+        limit: Maximum requests per window
+        window_seconds: Window length in seconds (default: 15 minutes)
 
-        # Clean old requests
-        now = time.time()
-        window_start = now - self.window_seconds
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if req_time > window_start
-        ]
+    Returns:
+        Callable: Async dependency returning the rate limit headers
 
-        return max(limit - len(self.requests[key]), 0)
+    Raises:
+        RateLimitExceeded: From the dependency, when the limit is exceeded
+    """
 
-    def get_reset_time(self) -> int:
-        """
-        Get timestamp when rate limit window resets.
+    async def check(request: Request) -> Dict[str, str]:
+        if not settings.RATE_LIMIT_ENABLED:
+            return {}
 
-        Returns:
-            int: Unix timestamp
-        """
-        return int(time.time() + self.window_seconds)
+        checked = getattr(request.state, "rate_limit_checked", None)
+        if checked is None:
+            checked = request.state.rate_limit_checked = {}
+        if endpoint_key in checked:
+            return checked[endpoint_key]
+
+        ip = request.client.host if request.client else "unknown"
+
+        try:
+            count, reset_ms = await rate_limiter.hit(f"{endpoint_key}:{ip}", window_seconds)
+        except Exception as e:
+            # Fail open: an unavailable limiter store must not take the API down
+            logger.warning(f"Rate limiter unavailable: {str(e)}")
+            checked[endpoint_key] = {}
+            return {}
+
+        retry_after = -(-reset_ms // 1000)
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(limit - count, 0)),
+            "X-RateLimit-Reset": str(int(time.time()) + retry_after),
+        }
+
+        checked[endpoint_key] = headers
+        if count > limit:
+            raise RateLimitExceeded(limit, window_seconds, retry_after, headers)
+
+        request.state.rate_limit_headers = headers
+        return headers
+
+    async def dependency(request: Request, response: Response) -> Dict[str, str]:
+        headers = await check(request)
+        response.headers.update(headers)
+        return headers
+
+    dependency.before_body = check
+    return dependency
+
+
+def get_rate_limit_headers(request: Request) -> Dict[str, str]:
+    """
+    Get the X-RateLimit-* headers computed for a request.
+
+    Args:
+        request: Current request
+
+    Returns:
+        dict: Headers set by a rate limit dependency, or {} if none ran
+    """
+    return getattr(request.state, "rate_limit_headers", {})
 
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+rate_limiter = RedisRateLimiter(settings.REDIS_URL) if settings.REDIS_ENABLED else RateLimiter()
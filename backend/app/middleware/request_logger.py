@@ -4,12 +4,17 @@ Logs all API requests without PII
 """
 
 import logging
+import logging.handlers
 import hashlib
+import queue
 from datetime import datetime
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Background thread writing queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def hash_ip(ip: str) -> str:
     """
@@ -41,6 +46,10 @@ def log_request(
         duration: Request duration in seconds
         ip: Client IP address
     """
+    # Skip hashing and formatting when nothing would be emitted
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     # Hash IP for privacy
     ip_hash = hash_ip(ip)
 
@@ -69,3 +78,43 @@ def log_error(
     logger.error(
         f"{method} {path} - ERROR: {error}"
     )
+
+
+def start_background_logging() -> None:
+    """
+    Hand request log records to a background thread.
+
+    The request logger's records are queued, and a QueueListener thread
+    passes them to the root handlers. Slow handlers (files, sockets) then
+    never block the event loop.
+    """
+    global _listener
+
+    handlers = logging.getLogger().handlers
+    if _listener is not None or not handlers:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    _listener.start()
+
+
+def stop_background_logging() -> None:
+    """Flush queued log records and stop the background thread."""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+    logger.propagate = True
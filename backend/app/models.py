@@ -2,10 +2,37 @@
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field, EmailStr, field_validator
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, Field, WithJsonSchema, field_validator
+from typing import Annotated, Optional, List
 from datetime import datetime
 from enum import Enum
+import re
+
+
+# ============================================================================
+# TYPES
+# ============================================================================
+
+# Syntactic check only; the API never resolves mail domains, so the heavier
+# email-validator parsing behind EmailStr bought nothing
+# (?!\n) stops Python's $ matching before a trailing newline; it is a no-op
+# in JSON schema (ECMAScript) regexes, so the pattern is valid in both
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$(?!\n)"
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+
+def _check_email(value: str) -> str:
+    """Reject strings that don't look like an email address."""
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+EmailAddress = Annotated[
+    str,
+    AfterValidator(_check_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
 
 
 # ============================================================================
@@ -58,7 +85,7 @@ class EmailType(str, Enum):
 class ContactInfo(BaseModel):
     """Contact information."""
     name: str = Field(..., min_length=2, max_length=100)
-    email: EmailStr
+    email: EmailAddress
     phone: Optional[str] = Field(None, pattern=r"^[\d\s\-\+\(\)]{10,}$")
 
 
@@ -115,7 +142,7 @@ class SaveProgressResponse(BaseModel):
 
 class SendEmailRequest(BaseModel):
     """Request body for sending email results."""
-    email: EmailStr
+    email: EmailAddress
     assessmentId: str
     sentAt: Optional[datetime] = None
 
@@ -177,7 +204,7 @@ class LeadDocument(BaseModel):
     """Lead document in MongoDB."""
     leadId: str
     name: str
-    email: EmailStr
+    email: EmailAddress
     phone: Optional[str] = None
 
     source: str
@@ -214,7 +241,7 @@ class LeadDocument(BaseModel):
 class EmailLogDocument(BaseModel):
     """Email log document in MongoDB."""
     messageId: str
-    recipientEmail: EmailStr
+    recipientEmail: EmailAddress
     recipientName: Optional[str] = None
 
     subject: str
@@ -2,7 +2,7 @@
 Assessment router - handles assessment submission and progress saving
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import Depends, HTTPException
 from datetime import datetime
 import uuid
 
@@ -21,11 +21,18 @@ from ..models import (
 from ..database import get_database
 from ..services.qualification import determine_qualification_status
 from ..utils.sanitizer import sanitize_text
+from ..config import settings
+from ..middleware.rate_limiter import rate_limit
+from ..utils.routing import FlatAPIRouter
 
-router = APIRouter()
+router = FlatAPIRouter()
 
 
-@router.post("/submit", response_model=SubmitAssessmentResponse)
+@router.post(
+    "/submit",
+    response_model=SubmitAssessmentResponse,
+    dependencies=[Depends(rate_limit("assessment_submit", settings.RATE_LIMIT_SUBMIT_ASSESSMENT))],
+)
 async def submit_assessment(request: SubmitAssessmentRequest):
     """
     Submit a completed assessment with contact information.
@@ -126,7 +133,11 @@ async def submit_assessment(request: SubmitAssessmentRequest):
         )
 
 
-@router.post("/save-progress", response_model=SaveProgressResponse)
+@router.post(
+    "/save-progress",
+    response_model=SaveProgressResponse,
+    dependencies=[Depends(rate_limit("assessment_save_progress", settings.RATE_LIMIT_SAVE_PROGRESS))],
+)
 async def save_progress(request: SaveProgressRequest):
     """
     Save assessment progress for incomplete assessments.
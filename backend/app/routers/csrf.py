@@ -3,12 +3,14 @@ CSRF Token Router
 Provides CSRF token generation and validation endpoints
 """
 
-from fastapi import APIRouter, Response
+from fastapi import Response
 from datetime import datetime, timedelta
 import secrets
 import hashlib
 
-router = APIRouter()
+from ..utils.routing import FlatAPIRouter
+
+router = FlatAPIRouter()
 
 # In-memory storage for CSRF tokens (in production, use Redis or similar)
 # Format: {token_hash: expiry_timestamp}
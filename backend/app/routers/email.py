@@ -2,7 +2,7 @@
 Email router - handles sending assessment results via email
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import Depends, HTTPException
 from datetime import datetime
 import uuid
 
@@ -16,11 +16,17 @@ from ..models import (
 from ..database import get_database
 from ..services.email_service import send_assessment_results_email
 from ..config import settings
+from ..middleware.rate_limiter import rate_limit
+from ..utils.routing import FlatAPIRouter
 
-router = APIRouter()
+router = FlatAPIRouter()
 
 
-@router.post("/send-results", response_model=SendEmailResponse)
+@router.post(
+    "/send-results",
+    response_model=SendEmailResponse,
+    dependencies=[Depends(rate_limit("email_send_results", settings.RATE_LIMIT_SEND_EMAIL))],
+)
 async def send_results(request: SendEmailRequest):
     """
     Send assessment results to user's email.
@@ -2,13 +2,13 @@
 Health check router
 """
 
-from fastapi import APIRouter
 from datetime import datetime
 
 from ..config import settings
 from ..database import get_database
+from ..utils.routing import FlatAPIRouter
 
-router = APIRouter()
+router = FlatAPIRouter()
 
 
 @router.get("/health")
@@ -3,22 +3,96 @@ Quiz Router
 Handles the new quiz assessment flow with branching logic
 """
 
-from fastapi import APIRouter, HTTPException, Response
-from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional, Dict, Any
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Any, Callable, Deque, Dict, Final, List, Optional, Tuple
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import os
+import sys
+import threading
 import uuid
 
-router = APIRouter()
+import msgspec
+import orjson
+
+from ..config import settings
+from ..middleware.rate_limiter import rate_limit
+from ..models import EMAIL_PATTERN, EmailAddress
+from ..services.audit_log import audit_log
+from ..services.notification_queue import welcome_email_batcher, welcome_sms_batcher
+from ..utils.batching import BatchItem, Batcher
+from ..utils.request_body import struct_body, struct_openapi_body
+from ..utils.routing import FlatAPIRouter
+
+router = FlatAPIRouter()
+
+# ============================================================================
+# ID AND TIMESTAMP DEFAULTS
+# ============================================================================
+
+# Quiz IDs are drawn from a pool filled by one os.urandom() call per batch
+# rather than one getrandom syscall per uuid4()
+_UUID_BATCH_SIZE = 1024
+_UUID_POOL: Deque[str] = deque()
+_UUID_POOL_LOCK = threading.Lock()
+
+# utcnow() is read once per request and shared by every defaulted timestamp
+_REQUEST_NOW: ContextVar[Optional[datetime]] = ContextVar("quiz_request_now", default=None)
+
+
+def _refill_uuid_pool(n: int = _UUID_BATCH_SIZE) -> None:
+    """Generate n random (version 4) UUID strings into the pool"""
+    raw = os.urandom(16 * n)
+    _UUID_POOL.extend(
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, len(raw), 16)
+    )
+
+
+def _next_uuid() -> str:
+    """Return the next pre-generated UUID string, refilling the pool if empty"""
+    while True:
+        try:
+            return _UUID_POOL.popleft()
+        except IndexError:
+            with _UUID_POOL_LOCK:
+                if not _UUID_POOL:
+                    _refill_uuid_pool()
+
+
+def _request_utcnow() -> datetime:
+    """Return the current UTC time, memoized for the current request"""
+    now = _REQUEST_NOW.get()
+    if now is None:
+        now = datetime.utcnow()
+        _REQUEST_NOW.set(now)
+    return now
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
 
-class QuizResponse(BaseModel):
+# Submit payloads are msgspec Structs decoded straight from the request body;
+# Pydantic validation dominated the cost of these endpoints.
+
+# msgspec applies the pattern with one re.search during decoding
+EmailField = Annotated[
+    str,
+    msgspec.Meta(pattern=EMAIL_PATTERN, extra_json_schema={"format": "email"}),
+]
+
+
+class QuizResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Quiz response data model"""
     # Quiz ID
-    quiz_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    quiz_id: str = msgspec.field(default_factory=_next_uuid)
     
     # Q1: Time Duration
     pain_duration: Optional[str] = None  # "6_months_or_less" or "more_than_6_months"
@@ -46,7 +120,7 @@ class QuizResponse(BaseModel):
     
     # Contact Information
     name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     phone: Optional[str] = None
     
     # Metadata
@@ -55,7 +129,7 @@ class QuizResponse(BaseModel):
     non_treatable_conditions: Optional[List[str]] = None
     
     # Timestamps
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = msgspec.field(default_factory=_request_utcnow)
     completed_at: Optional[datetime] = None
     
     # Additional fields
@@ -63,31 +137,75 @@ class QuizResponse(BaseModel):
     wants_notification: Optional[bool] = None  # For disqualified users
 
 
-class ContactFormSubmission(BaseModel):
+class ContactFormSubmission(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Contact form submission from congratulations page"""
     quiz_id: str
-    name: str = Field(..., min_length=1, max_length=100)
-    email: EmailStr
-    phone: str = Field(..., min_length=10)
+    name: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    email: EmailField
+    phone: Annotated[str, msgspec.Meta(min_length=10)]
+    consent_to_text: bool = True
+
+
+class WaitingListSubmission(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Waiting list form from the disqualified (too soon) page"""
+    quiz_id: Optional[str] = None
+    name: str
+    email: EmailField
+    phone: str
+    approximate_pain_start_date: Optional[str] = None
+    consent_to_text: bool = True
+
+
+class NotifyMeSubmission(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Notification request from the disqualified (non-treatable) page"""
+    quiz_id: str
+    name: str
+    email: EmailField
+    phone: str
+    non_treatable_conditions: List[str]
     consent_to_text: bool = True
 
 
+_quiz_body = struct_body(QuizResponse)
+_contact_body = struct_body(ContactFormSubmission)
+_waiting_list_body = struct_body(WaitingListSubmission)
+_notify_me_body = struct_body(NotifyMeSubmission)
+
+# The four submit routes share one per-IP budget
+_quiz_submit_limit = rate_limit("quiz_submit", settings.RATE_LIMIT_QUIZ_SUBMIT)
+
+
 class QuizAnalysisResponse(BaseModel):
     """Response containing quiz analysis and routing"""
+    # Frozen, with tuple fields, so the shared module-level and cached
+    # instances below can't be mutated
+    model_config = ConfigDict(frozen=True)
+
     qualification_status: str
-    treatable_conditions: List[str]
-    non_treatable_conditions: List[str]
+    treatable_conditions: Tuple[str, ...]
+    non_treatable_conditions: Tuple[str, ...]
     should_show_primary_cell: bool
     should_show_alternative_primary_cell: bool
     requires_manual_review: bool
     disqualification_reason: Optional[str] = None
 
 
+# ============================================================================
+# QUALIFICATION STATUSES
+# ============================================================================
+
+# Interned once so responses built here share one object per status, and
+# code that controls the assignment can compare with `is`
+_Q_QUALIFIED: Final = sys.intern("qualified")
+_Q_MANUAL: Final = sys.intern("manual_review")
+_Q_DISQ_NT: Final = sys.intern("disqualified_non_treatable")
+
+
 # ============================================================================
 # CONDITION CATEGORIZATION
 # ============================================================================
 
-TREATABLE_CONDITIONS = {
+TREATABLE_CONDITIONS = frozenset({
     "chronic_back_pain",
     "chronic_neck_pain",
     "bone_on_bone_joint_pain",
@@ -98,22 +216,166 @@ TREATABLE_CONDITIONS = {
     "si_joint_pain",
     "pelvic_pain",
     "mystery_pain",
-}
+})
 
-NON_TREATABLE_CONDITIONS = {
+NON_TREATABLE_CONDITIONS = frozenset({
     "chronic_fatigue_syndrome",
     "autoimmune_diseases",
     "fibromyalgia",
     "infectious_diseases",
     "endocrine_disorders",
     "gastrointestinal_disorders",
+})
+
+# Every known condition gets a stable bit so a selection can be reduced to a
+# single int and classified with two mask tests instead of set intersections.
+CONDITION_BIT: Dict[str, int] = {
+    name: 1 << index
+    for index, name in enumerate(
+        sorted(TREATABLE_CONDITIONS) + sorted(NON_TREATABLE_CONDITIONS)
+    )
 }
 
+TREATABLE_MASK = sum(CONDITION_BIT[name] for name in TREATABLE_CONDITIONS)
+NON_TREATABLE_MASK = sum(CONDITION_BIT[name] for name in NON_TREATABLE_CONDITIONS)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _conditions_in(mask: int) -> Tuple[str, ...]:
+    """Return the condition IDs whose bits are set in mask, in CONDITION_BIT order"""
+    return tuple(name for name, bit in CONDITION_BIT.items() if mask & bit)
+
+
+# Every routing case is built once at import. Cases whose payload varies only
+# by the selected conditions use model_copy(), which skips revalidation, and
+# are cached per selection mask by _analyze_cached().
+_MANUAL_REVIEW_OTHER_ONLY = QuizAnalysisResponse(
+    qualification_status=_Q_MANUAL,
+    treatable_conditions=(),
+    non_treatable_conditions=(),
+    should_show_primary_cell=False,
+    should_show_alternative_primary_cell=True,
+    requires_manual_review=True,
+)
+
+_MANUAL_REVIEW_MIXED_OTHER = QuizAnalysisResponse(
+    qualification_status=_Q_MANUAL,
+    treatable_conditions=(),
+    non_treatable_conditions=(),
+    should_show_primary_cell=False,
+    should_show_alternative_primary_cell=True,
+    requires_manual_review=True,
+)
+
+_QUALIFIED_EMPTY = QuizAnalysisResponse(
+    qualification_status=_Q_QUALIFIED,
+    treatable_conditions=(),
+    non_treatable_conditions=(),
+    should_show_primary_cell=True,
+    should_show_alternative_primary_cell=False,
+    requires_manual_review=False,
+)
+
+_DISQUALIFIED_NON_TREATABLE_EMPTY = QuizAnalysisResponse(
+    qualification_status=_Q_DISQ_NT,
+    treatable_conditions=(),
+    non_treatable_conditions=(),
+    should_show_primary_cell=False,
+    should_show_alternative_primary_cell=False,
+    requires_manual_review=False,
+    disqualification_reason="non_treatable_only",
+)
+
+_FALLBACK_MANUAL_REVIEW = QuizAnalysisResponse(
+    qualification_status=_Q_MANUAL,
+    treatable_conditions=(),
+    non_treatable_conditions=(),
+    should_show_primary_cell=False,
+    should_show_alternative_primary_cell=True,
+    requires_manual_review=True,
+)
+
+
+def _case_fallback(mask: int) -> QuizAnalysisResponse:
+    # Default: nothing recognised and no "Other" - handle gracefully
+    return _FALLBACK_MANUAL_REVIEW
+
+
+def _case_non_treatable_only(mask: int) -> QuizAnalysisResponse:
+    # Case 5: Only non-treatable conditions
+    return _DISQUALIFIED_NON_TREATABLE_EMPTY.model_copy(update={
+        "non_treatable_conditions": _conditions_in(mask & NON_TREATABLE_MASK),
+    })
+
+
+def _case_treatable_only(mask: int) -> QuizAnalysisResponse:
+    # Case 4: Only treatable conditions
+    return _QUALIFIED_EMPTY.model_copy(update={
+        "treatable_conditions": _conditions_in(mask & TREATABLE_MASK),
+    })
+
+
+def _case_mixed(mask: int) -> QuizAnalysisResponse:
+    # Case 6: Mixed (treatable + non-treatable, no other)
+    return _QUALIFIED_EMPTY.model_copy(update={
+        "treatable_conditions": _conditions_in(mask & TREATABLE_MASK),
+        "non_treatable_conditions": _conditions_in(mask & NON_TREATABLE_MASK),
+    })
+
+
+def _case_other_only(mask: int) -> QuizAnalysisResponse:
+    # Case 1: Other only
+    return _MANUAL_REVIEW_OTHER_ONLY
+
+
+def _case_other_non_treatable(mask: int) -> QuizAnalysisResponse:
+    # Case 3: Other + non-treatable (without treatable)
+    return _MANUAL_REVIEW_MIXED_OTHER.model_copy(update={
+        "non_treatable_conditions": _conditions_in(mask & NON_TREATABLE_MASK),
+    })
+
+
+def _case_other_treatable(mask: int) -> QuizAnalysisResponse:
+    # Case 2: Other + treatable only - should still go to manual review first
+    return _MANUAL_REVIEW_MIXED_OTHER.model_copy(update={
+        "treatable_conditions": _conditions_in(mask & TREATABLE_MASK),
+    })
+
+
+def _case_other_mixed(mask: int) -> QuizAnalysisResponse:
+    # Case 3: Other + non-treatable (with treatable)
+    return _MANUAL_REVIEW_MIXED_OTHER.model_copy(update={
+        "treatable_conditions": _conditions_in(mask & TREATABLE_MASK),
+        "non_treatable_conditions": _conditions_in(mask & NON_TREATABLE_MASK),
+    })
+
+
+# Indexed by (has_other << 2) | (has_treatable << 1) | has_non_treatable
+_CASE_TABLE: Tuple[Callable[[int], QuizAnalysisResponse], ...] = (
+    _case_fallback,
+    _case_non_treatable_only,
+    _case_treatable_only,
+    _case_mixed,
+    _case_other_only,
+    _case_other_non_treatable,
+    _case_other_treatable,
+    _case_other_mixed,
+)
+
+
+@lru_cache(maxsize=4096)
+def _analyze_cached(mask: int, has_other: bool) -> QuizAnalysisResponse:
+    """Classify a selection mask; the result is shared by every equal selection"""
+    has_treatable = bool(mask & TREATABLE_MASK)
+    has_non_treatable = bool(mask & NON_TREATABLE_MASK)
+
+    case = (has_other << 2) | (has_treatable << 1) | has_non_treatable
+    return _CASE_TABLE[case](mask)
+
+
 def analyze_conditions(conditions: List[str], has_other: bool = False) -> QuizAnalysisResponse:
     """
     Analyze selected conditions and determine qualification status
@@ -125,106 +387,33 @@ def analyze_conditions(conditions: List[str], has_other: bool = False) -> QuizAn
     Returns:
         QuizAnalysisResponse with routing information
     """
-    condition_set = set(conditions)
-    
-    # Separate treatable and non-treatable
-    treatable = list(condition_set & TREATABLE_CONDITIONS)
-    non_treatable = list(condition_set & NON_TREATABLE_CONDITIONS)
-    
-    # Determine routing logic
-    has_treatable = len(treatable) > 0
-    has_non_treatable = len(non_treatable) > 0
-    
-    # Case 1: Other only
-    if has_other and not has_treatable and not has_non_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="manual_review",
-            treatable_conditions=[],
-            non_treatable_conditions=[],
-            should_show_primary_cell=False,
-            should_show_alternative_primary_cell=True,
-            requires_manual_review=True,
-        )
-    
-    # Case 2: Other + treatable only - should still go to manual review first
-    if has_other and has_treatable and not has_non_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="manual_review",
-            treatable_conditions=treatable,
-            non_treatable_conditions=[],
-            should_show_primary_cell=False,
-            should_show_alternative_primary_cell=True,
-            requires_manual_review=True,
-        )
-    
-    # Case 3: Other + non-treatable (with or without treatable)
-    if has_other and has_non_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="manual_review",
-            treatable_conditions=treatable,
-            non_treatable_conditions=non_treatable,
-            should_show_primary_cell=False,
-            should_show_alternative_primary_cell=True,
-            requires_manual_review=True,
-        )
-    
-    # Case 4: Only treatable conditions
-    if has_treatable and not has_non_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="qualified",
-            treatable_conditions=treatable,
-            non_treatable_conditions=[],
-            should_show_primary_cell=True,
-            should_show_alternative_primary_cell=False,
-            requires_manual_review=False,
-        )
-    
-    # Case 5: Only non-treatable conditions
-    if has_non_treatable and not has_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="disqualified_non_treatable",
-            treatable_conditions=[],
-            non_treatable_conditions=non_treatable,
-            should_show_primary_cell=False,
-            should_show_alternative_primary_cell=False,
-            requires_manual_review=False,
-            disqualification_reason="non_treatable_only",
-        )
-    
-    # Case 6: Mixed (treatable + non-treatable, no other)
-    if has_treatable and has_non_treatable:
-        return QuizAnalysisResponse(
-            qualification_status="qualified",
-            treatable_conditions=treatable,
-            non_treatable_conditions=non_treatable,
-            should_show_primary_cell=True,
-            should_show_alternative_primary_cell=False,
-            requires_manual_review=False,
-        )
-    
-    # Default: shouldn't reach here but handle gracefully
-    return QuizAnalysisResponse(
-        qualification_status="manual_review",
-        treatable_conditions=[],
-        non_treatable_conditions=[],
-        should_show_primary_cell=False,
-        should_show_alternative_primary_cell=True,
-        requires_manual_review=True,
-    )
+    selected_mask = 0
+    for condition in conditions:
+        selected_mask |= CONDITION_BIT.get(condition, 0)
+
+    return _analyze_cached(selected_mask, bool(has_other))
 
 
-class ConditionAnalysisRequest(BaseModel):
-    """Request model for condition analysis"""
+# Documents the analyze-conditions body; the endpoint checks its shape itself
+class ConditionAnalysisRequest(msgspec.Struct, kw_only=True):
+    """Request body for condition analysis"""
     conditions: List[str]
     condition_other: Optional[str] = None
 
 
+def _invalid_body(error_type: str, message: str) -> RequestValidationError:
+    """Build the 422 error raised for a malformed analyze-conditions body."""
+    return RequestValidationError(
+        [{"type": error_type, "loc": ("body",), "msg": message, "input": None}]
+    )
+
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
-@router.post("/analyze-conditions")
-async def analyze_conditions_endpoint(request: ConditionAnalysisRequest):
+@router.post("/analyze-conditions", openapi_extra=struct_openapi_body(ConditionAnalysisRequest))
+async def analyze_conditions_endpoint(request: Request):
     """
     Analyze selected conditions and return routing information
     
@@ -233,138 +422,190 @@ async def analyze_conditions_endpoint(request: ConditionAnalysisRequest):
     - Which educational page to show
     - Whether manual review is needed
     """
-    has_other = bool(request.condition_other and request.condition_other.strip())
-    analysis = analyze_conditions(request.conditions, has_other)
+    # The body is two fields, so check its shape by hand instead of
+    # building a validation model per request
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as exc:
+        raise _invalid_body("json_invalid", str(exc))
+
+    if not isinstance(body, dict):
+        raise _invalid_body("model_attributes_type", "Input should be an object")
+
+    conditions = body.get("conditions")
+    if not isinstance(conditions, list) or not all(isinstance(c, str) for c in conditions):
+        raise _invalid_body("list_type", "`conditions` should be a list of strings")
+
+    condition_other = body.get("condition_other")
+    if condition_other is not None and not isinstance(condition_other, str):
+        raise _invalid_body("string_type", "`condition_other` should be a string")
+
+    has_other = bool(condition_other and condition_other.strip())
+    analysis = analyze_conditions(conditions, has_other)
     
-    return analysis
+    # Serialize directly rather than letting FastAPI re-encode the model
+    return ORJSONResponse(analysis.model_dump())
 
 
-@router.post("/submit-quiz")
-async def submit_quiz(quiz_data: QuizResponse):
+@router.post("/submit-quiz", openapi_extra=struct_openapi_body(QuizResponse))
+async def submit_quiz(
+    rate_limit_headers: Dict[str, str] = Depends(_quiz_submit_limit),
+    quiz_data: QuizResponse = Depends(_quiz_body),
+):
     """
     Submit complete quiz response
     
     Stores quiz data and returns submission confirmation
     """
-    try:
-        # In production, save to MongoDB
-        # For now, just validate and return success
-        
-        quiz_data.completed_at = datetime.utcnow()
-        
-        return {
-            "success": True,
-            "quiz_id": quiz_data.quiz_id,
-            "qualification_status": quiz_data.qualification_status,
-            "message": "Quiz response recorded successfully",
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error submitting quiz: {str(e)}")
-
-
-@router.post("/submit-contact")
-async def submit_contact_form(contact: ContactFormSubmission):
+    # In production, save to MongoDB
+    # For now, just validate and return success
+    
+    quiz_data.completed_at = _request_utcnow()
+    audit_log.record("quiz_submitted", quiz_id=quiz_data.quiz_id)
+    
+    return ORJSONResponse({
+        "success": True,
+        "quiz_id": quiz_data.quiz_id,
+        "qualification_status": quiz_data.qualification_status,
+        "message": "Quiz response recorded successfully",
+    }, headers=rate_limit_headers)
+
+
+@router.post("/submit-contact", openapi_extra=struct_openapi_body(ContactFormSubmission))
+async def submit_contact_form(
+    rate_limit_headers: Dict[str, str] = Depends(_quiz_submit_limit),
+    contact: ContactFormSubmission = Depends(_contact_body),
+):
     """
     Submit contact form from congratulations page
     
     Triggers email/SMS automation (placeholder for now)
     """
-    try:
-        # In production:
-        # 1. Save contact info to database
-        # 2. Trigger welcome email with video link
-        # 3. Trigger welcome SMS
-        # 4. If manual review needed, flag for practitioner
-        
-        return {
-            "success": True,
-            "message": "Contact information received",
-            "redirect_to": "/welcome",
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error submitting contact form: {str(e)}")
+    # In production:
+    # 1. Save contact info to database
+    # 2. Trigger welcome email with video link
+    # 3. Trigger welcome SMS
+    # 4. If manual review needed, flag for practitioner
+    audit_log.record("contact_submitted", quiz_id=contact.quiz_id)
+    
+    return ORJSONResponse({
+        "success": True,
+        "message": "Contact information received",
+        "redirect_to": "/welcome",
+    }, headers=rate_limit_headers)
 
 
-@router.post("/disqualified-waiting-list")
+@router.post("/disqualified-waiting-list", openapi_extra=struct_openapi_body(WaitingListSubmission))
 async def submit_waiting_list(
-    quiz_id: str,
-    name: str,
-    email: EmailStr,
-    phone: str,
-    approximate_pain_start_date: Optional[str] = None,
+    rate_limit_headers: Dict[str, str] = Depends(_quiz_submit_limit),
+    submission: WaitingListSubmission = Depends(_waiting_list_body),
 ):
     """
     Submit waiting list form for disqualified users (too soon)
     
     Stores contact info for future follow-up
     """
-    try:
-        # In production:
-        # 1. Save to waiting list database
-        # 2. Calculate follow-up date (6 months from pain start)
-        # 3. Schedule automated email/SMS for future
-        
-        return {
-            "success": True,
-            "message": "Added to waiting list successfully",
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error adding to waiting list: {str(e)}")
+    # In production:
+    # 1. Save to waiting list database
+    # 2. Calculate follow-up date (6 months from pain start)
+    # 3. Schedule automated email/SMS for future
+    # The too-soon page usually has no quiz id, leaving nothing to audit
+    if submission.quiz_id:
+        audit_log.record("waiting_list_joined", quiz_id=submission.quiz_id)
+    
+    return ORJSONResponse({
+        "success": True,
+        "message": "Added to waiting list successfully",
+    }, headers=rate_limit_headers)
 
 
-@router.post("/disqualified-notify-me")
+@router.post("/disqualified-notify-me", openapi_extra=struct_openapi_body(NotifyMeSubmission))
 async def submit_notify_me(
-    quiz_id: str,
-    name: str,
-    email: EmailStr,
-    phone: str,
-    non_treatable_conditions: List[str],
+    rate_limit_headers: Dict[str, str] = Depends(_quiz_submit_limit),
+    submission: NotifyMeSubmission = Depends(_notify_me_body),
 ):
     """
     Submit notification request for non-treatable conditions
     
     Stores contact info for future updates when techniques are developed
     """
-    try:
-        # In production:
-        # 1. Save to notification list database
-        # 2. Tag with specific conditions they're interested in
-        
-        return {
-            "success": True,
-            "message": "Notification preferences saved",
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error saving notification: {str(e)}")
+    # In production:
+    # 1. Save to notification list database
+    # 2. Tag with specific conditions they're interested in
+    audit_log.record("notify_me_saved", quiz_id=submission.quiz_id)
+    
+    return ORJSONResponse({
+        "success": True,
+        "message": "Notification preferences saved",
+    }, headers=rate_limit_headers)
 
 
 # ============================================================================
 # PLACEHOLDER ENDPOINTS FOR FUTURE EMAIL/SMS
 # ============================================================================
 
-@router.post("/send-welcome-email")
-async def send_welcome_email_placeholder(email: EmailStr, name: str, video_link: str):
+# The placeholder replies never change, so they are serialized once
+_EMAIL_PLACEHOLDER_BODY = orjson.dumps({
+    "success": True,
+    "message": "Email endpoint ready - connect your email service to activate",
+    "placeholder": True,
+})
+
+_SMS_PLACEHOLDER_BODY = orjson.dumps({
+    "success": True,
+    "message": "SMS endpoint ready - connect your SMS service to activate",
+    "placeholder": True,
+})
+
+
+def _enqueue_notification(batcher: Batcher, notification: BatchItem) -> None:
+    """
+    Queue a notification, rejecting the request when the queue can't take it.
+
+    Raises:
+        HTTPException: 503 if the queue is full or its worker isn't running
+    """
+    try:
+        batcher.enqueue(notification)
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": "Notifications are temporarily unavailable. Please try again later.",
+                "code": "SERVICE_UNAVAILABLE",
+            }
+        )
+
+
+@router.post("/send-welcome-email", status_code=202)
+async def send_welcome_email_placeholder(email: EmailAddress, name: str, video_link: str):
     """
     PLACEHOLDER: Send welcome email with video link
     
-    To be implemented when email service is ready
+    Queues the email for the next batch; the batch sender is to be
+    implemented when email service is ready
     """
-    return {
-        "success": True,
-        "message": "Email endpoint ready - connect your email service to activate",
-        "placeholder": True,
-    }
+    _enqueue_notification(welcome_email_batcher, {
+        "email": email,
+        "name": name,
+        "video_link": video_link,
+    })
+
+    return Response(_EMAIL_PLACEHOLDER_BODY, status_code=202, media_type="application/json")
 
 
-@router.post("/send-welcome-sms")
+@router.post("/send-welcome-sms", status_code=202)
 async def send_welcome_sms_placeholder(phone: str, name: str):
     """
     PLACEHOLDER: Send welcome SMS
     
-    To be implemented when SMS service is ready
+    Queues the SMS for the next batch; the batch sender is to be
+    implemented when SMS service is ready
     """
-    return {
-        "success": True,
-        "message": "SMS endpoint ready - connect your SMS service to activate",
-        "placeholder": True,
-    }
+    _enqueue_notification(welcome_sms_batcher, {
+        "phone": phone,
+        "name": name,
+    })
+
+    return Response(_SMS_PLACEHOLDER_BODY, status_code=202, media_type="application/json")
@@ -0,0 +1,125 @@
+"""
+Local audit log
+Appends PII-free submission events to a JSON-lines file in batches
+"""
+
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+import asyncio
+import logging
+import os
+
+import orjson
+
+from ..config import settings
+from ..utils.batching import BatchItem, Batcher
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLog:
+    """
+    Append-only JSON-lines audit file.
+
+    Events are queued on a Batcher and each batch is written with a single
+    `os.writev` call on a worker thread, so a burst of submissions costs
+    one write syscall instead of one per event and the event loop never
+    blocks on disk.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize audit log.
+
+        Args:
+            path: File to append to; an empty path disables the log
+        """
+        self.path = path
+        self.fd: Optional[int] = None
+        self.batcher = Batcher("audit log", self.write_batch)
+        # Executor write still running, e.g. after stop() cancelled the worker
+        self._pending_write: Optional[asyncio.Future] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are currently being recorded."""
+        return self.fd is not None
+
+    def open(self) -> None:
+        """Open the audit file and start the batch writer."""
+        if not self.path or self.fd is not None:
+            return
+
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o640)
+        self.batcher.start()
+
+    async def close(self) -> None:
+        """Write queued events and close the audit file."""
+        if self.fd is None:
+            return
+
+        await self.batcher.stop()
+
+        # A cancelled worker leaves its thread writing; let it finish first
+        if self._pending_write is not None:
+            await asyncio.gather(self._pending_write, return_exceptions=True)
+            self._pending_write = None
+
+        fd, self.fd = self.fd, None
+        os.close(fd)
+
+    def record(self, event: str, **fields: Any) -> None:
+        """
+        Queue an audit event, dropping it with a warning if the queue is full.
+
+        Callers must only pass opaque identifiers, never contact details
+        or anything revealing health information, such as a
+        qualification status.
+
+        Args:
+            event: Event name, e.g. "quiz_submitted"
+            **fields: Extra identifier fields stored with the event
+        """
+        if self.fd is None:
+            return
+
+        try:
+            self.batcher.enqueue({
+                "event": event,
+                "at": datetime.now(timezone.utc),
+                **fields,
+            })
+        except asyncio.QueueFull as e:
+            # Auditing must never fail the submission it describes
+            logger.warning(f"Dropped audit event {event}: {str(e)}")
+
+    async def write_batch(self, batch: List[BatchItem]) -> None:
+        """
+        Append a batch of events to the audit file.
+
+        Args:
+            batch: Events queued by record()
+        """
+        lines = [orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in batch]
+
+        self._pending_write = asyncio.get_running_loop().run_in_executor(
+            None, _writev, self.fd, lines
+        )
+        # Shielded so cancelling the worker can't orphan a running write
+        await asyncio.shield(self._pending_write)
+        self._pending_write = None
+
+
+def _writev(fd: int, lines: List[bytes]) -> None:
+    """Write all lines to fd, retrying the remainder after a short write."""
+    written = os.writev(fd, lines)
+    if written == sum(len(line) for line in lines):
+        return
+
+    remaining = b"".join(lines)[written:]
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+
+# Global audit log instance, opened on application startup
+audit_log = AuditLog(settings.AUDIT_LOG_PATH)
@@ -0,0 +1,40 @@
+"""
+Outbound notification batching
+Queues welcome emails/SMS and hands them to the provider in batches
+"""
+
+from typing import List
+import logging
+
+from ..utils.batching import BatchItem, Batcher
+
+logger = logging.getLogger(__name__)
+
+
+async def send_welcome_email_batch(batch: List[BatchItem]) -> None:
+    """
+    PLACEHOLDER: Send a batch of welcome emails with video links.
+
+    To be implemented when email service is ready.
+
+    Args:
+        batch: Notifications with email, name and video_link
+    """
+    logger.info(f"Welcome email batch ready: {len(batch)} message(s)")
+
+
+async def send_welcome_sms_batch(batch: List[BatchItem]) -> None:
+    """
+    PLACEHOLDER: Send a batch of welcome SMS messages.
+
+    To be implemented when SMS service is ready.
+
+    Args:
+        batch: Notifications with phone and name
+    """
+    logger.info(f"Welcome SMS batch ready: {len(batch)} message(s)")
+
+
+# Global batcher instances, started on application startup
+welcome_email_batcher = Batcher("welcome email", send_welcome_email_batch)
+welcome_sms_batcher = Batcher("welcome SMS", send_welcome_sms_batch)
@@ -0,0 +1,131 @@
+"""
+Batching utilities
+Queue items and hand them to a coroutine in batches from one worker task
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+BatchItem = Dict[str, Any]
+
+
+class Batcher:
+    """
+    Collects queued items and flushes them from one worker task.
+
+    Each flush hands up to `batch_size` items to a single `send_batch`
+    call, so per-call setup (a provider connection, a write syscall) is
+    paid once per batch rather than once per item.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send_batch: Callable[[List[BatchItem]], Awaitable[None]],
+        maxsize: int = 2048,
+        batch_size: int = 64,
+        flush_interval: float = 0.05,
+        drain_timeout: float = 10.0,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            name: Batcher name used in logs
+            send_batch: Coroutine handling a list of items
+            maxsize: Maximum queued items before enqueue is rejected
+            batch_size: Maximum items per send_batch call
+            flush_interval: Seconds to wait for a batch to fill up
+            drain_timeout: Seconds stop() waits for queued items
+        """
+        self.name = name
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drain_timeout = drain_timeout
+        self.maxsize = maxsize
+        # Created by start(): a queue is bound to the loop that first uses it
+        self.queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the worker task, with a fresh queue, on the running event loop."""
+        if self._worker is None:
+            self.queue = asyncio.Queue(maxsize=self.maxsize)
+            self._worker = asyncio.create_task(self._run())
+            self._worker.add_done_callback(self._log_worker_exit)
+
+    async def stop(self) -> None:
+        """Flush queued items and stop the worker task."""
+        if self._worker is None:
+            return
+
+        # A crashed worker will never drain the queue, so don't wait for it
+        if not self._worker.done():
+            try:
+                await asyncio.wait_for(self.queue.join(), self.drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Timed out flushing {self.name} queue on shutdown; "
+                    f"{self.queue.qsize()} item(s) still queued"
+                )
+
+        worker, self._worker = self._worker, None
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        self.queue = None
+
+    def enqueue(self, item: BatchItem) -> None:
+        """
+        Queue an item for the next batch without waiting.
+
+        Args:
+            item: Fields handed to send_batch
+
+        Raises:
+            asyncio.QueueFull: If the queue is full or the worker isn't running
+        """
+        if self._worker is None or self._worker.done():
+            raise asyncio.QueueFull(f"{self.name} worker is not running")
+
+        self.queue.put_nowait(item)
+
+    def _log_worker_exit(self, worker: asyncio.Task) -> None:
+        """Log a worker that died instead of being stopped."""
+        if not worker.cancelled() and worker.exception() is not None:
+            logger.error(f"{self.name} worker crashed: {str(worker.exception())}")
+
+    async def _run(self) -> None:
+        """Wait for an item, gather a batch, and send it."""
+        loop = asyncio.get_running_loop()
+        queue = self.queue
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                # Take whatever is already queued without waiting
+                while len(batch) < self.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                timeout = deadline - loop.time()
+                if len(batch) >= self.batch_size or timeout <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.send_batch(batch)
+            except Exception as e:
+                logger.error(f"{self.name} batch of {len(batch)} failed: {str(e)}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
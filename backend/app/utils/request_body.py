@@ -0,0 +1,69 @@
+"""
+Request body decoding utilities
+Decode JSON bodies straight into msgspec Structs, bypassing Pydantic
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Type, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+import msgspec
+
+T = TypeVar("T", bound=msgspec.Struct)
+
+
+def struct_body(struct_type: Type[T]) -> Callable[[Request], Awaitable[T]]:
+    """
+    Build a FastAPI dependency that decodes the request body into a Struct.
+
+    Decode failures are raised as RequestValidationError so clients get the
+    same 422 response shape as for Pydantic-validated bodies.
+
+    Args:
+        struct_type: msgspec Struct class describing the body
+
+    Returns:
+        Callable: Async dependency returning the decoded Struct
+    """
+    decoder = msgspec.json.Decoder(struct_type, strict=False)
+
+    async def dependency(request: Request) -> T:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as exc:
+            error_type = "value_error"
+            message = str(exc)
+        except msgspec.DecodeError as exc:
+            error_type = "json_invalid"
+            message = str(exc)
+
+        raise RequestValidationError(
+            [{"type": error_type, "loc": ("body",), "msg": message, "input": None}]
+        )
+
+    return dependency
+
+
+def struct_openapi_body(struct_type: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """
+    Build an `openapi_extra` entry documenting a Struct request body.
+
+    Endpoints using `struct_body` declare no body parameter, so FastAPI
+    can't infer the schema itself.
+
+    Args:
+        struct_type: msgspec Struct class describing the body
+
+    Returns:
+        dict: Value for the route's `openapi_extra` argument
+    """
+    _, components = msgspec.json.schema_components([struct_type])
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": components[struct_type.__name__]},
+            },
+        },
+    }
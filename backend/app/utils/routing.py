@@ -0,0 +1,170 @@
+"""
+Routing utilities
+Routers that defer APIRoute construction until they are included, and
+routes that parse JSON request bodies with orjson
+"""
+
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Iterator, List, Optional, Type
+
+from fastapi import APIRouter, Request, Response
+from fastapi.datastructures import Default
+from fastapi.dependencies.models import Dependant
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.utils import generate_unique_id, get_value_or_default
+import orjson
+
+
+# Attributes `include_router` reads from each route, with APIRoute's defaults
+_ROUTE_OPTIONS: Dict[str, Callable[[], Any]] = {
+    "response_model": lambda: Default(None),
+    "status_code": lambda: None,
+    "tags": list,
+    "dependencies": list,
+    "summary": lambda: None,
+    "description": lambda: None,
+    "response_description": lambda: "Successful Response",
+    "responses": dict,
+    "deprecated": lambda: None,
+    "methods": lambda: None,
+    "operation_id": lambda: None,
+    "response_model_include": lambda: None,
+    "response_model_exclude": lambda: None,
+    "response_model_by_alias": lambda: True,
+    "response_model_exclude_unset": lambda: False,
+    "response_model_exclude_defaults": lambda: False,
+    "response_model_exclude_none": lambda: False,
+    "include_in_schema": lambda: True,
+    "response_class": lambda: Default(JSONResponse),
+    "name": lambda: None,
+    "callbacks": list,
+    "openapi_extra": lambda: None,
+    "generate_unique_id_function": lambda: Default(generate_unique_id),
+}
+
+
+class ORJSONRequest(Request):
+    """Request whose json() parses the body with orjson instead of json.loads."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # FastAPI still turns malformed bodies into a 422
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+def _walk_dependants(dependant: Dependant) -> Iterator[Dependant]:
+    """Yield every sub-dependant of a route, depth first."""
+    for sub_dependant in dependant.dependencies:
+        yield sub_dependant
+        yield from _walk_dependants(sub_dependant)
+
+
+class ORJSONRoute(APIRoute):
+    """
+    APIRoute that hands its endpoint an ORJSONRequest.
+
+    FastAPI parses the request body before it resolves dependencies, so a
+    malformed body is rejected before any dependency runs. Dependencies
+    exposing a `before_body(request)` coroutine (such as rate limits) have
+    it awaited first, so they also apply to those requests.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        before_body: List[Callable[[Request], Awaitable[Any]]] = list(dict.fromkeys(
+            sub_dependant.call.before_body
+            for sub_dependant in _walk_dependants(self.dependant)
+            if hasattr(sub_dependant.call, "before_body")
+        ))
+
+        async def orjson_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            for hook in before_body:
+                await hook(request)
+            return await handler(request)
+
+        return orjson_route_handler
+
+
+class DeferredAPIRoute(ORJSONRoute):
+    """
+    APIRoute that can be recorded without being built.
+
+    A pending route only carries the options `include_router` copies; its
+    dependency graph and response field are computed once, when the app
+    rebuilds it through the regular APIRoute constructor.
+    """
+
+    @classmethod
+    def pending(cls, path: str, endpoint: Callable[..., Any], **options: Any) -> "DeferredAPIRoute":
+        """
+        Record a route without running APIRoute.__init__.
+
+        Args:
+            path: Full route path, including the router prefix
+            endpoint: Path operation function
+            **options: Keyword arguments accepted by APIRoute
+
+        Returns:
+            DeferredAPIRoute: Unbuilt route, only usable by include_router
+        """
+        route = cls.__new__(cls)
+        route.path = path
+        route.endpoint = endpoint
+        for option, default in _ROUTE_OPTIONS.items():
+            value = options.get(option)
+            setattr(route, option, default() if value is None else value)
+        return route
+
+
+class FlatAPIRouter(APIRouter):
+    """
+    APIRouter whose routes are only built by the router that includes it.
+
+    A plain APIRouter constructs every APIRoute when the endpoint is
+    declared, and `include_router` constructs it again for the parent.
+    FlatAPIRouter records pending routes instead, so each route is built
+    once at startup no matter how deeply routers are nested.
+
+    A FlatAPIRouter must be included (`app.include_router`) rather than
+    served directly.
+    """
+
+    def __init__(self, *args: Any, route_class: Type[APIRoute] = DeferredAPIRoute, **kwargs: Any):
+        super().__init__(*args, route_class=route_class, **kwargs)
+
+    def add_api_route(
+        self,
+        path: str,
+        endpoint: Callable[..., Any],
+        *,
+        route_class_override: Optional[Type[APIRoute]] = None,
+        **options: Any,
+    ) -> None:
+        route_class = route_class_override or self.route_class
+        if not issubclass(route_class, DeferredAPIRoute):
+            super().add_api_route(
+                path, endpoint, route_class_override=route_class_override, **options
+            )
+            return
+
+        # Merge router-level options the same way APIRouter.add_api_route does
+        options["responses"] = {**self.responses, **(options.get("responses") or {})}
+        options["response_class"] = get_value_or_default(
+            options.get("response_class", Default(JSONResponse)),
+            self.default_response_class,
+        )
+        for option in ("tags", "dependencies", "callbacks"):
+            options[option] = list(getattr(self, option)) + list(options.get(option) or [])
+        options["generate_unique_id_function"] = get_value_or_default(
+            options.get("generate_unique_id_function", Default(generate_unique_id)),
+            self.generate_unique_id_function,
+        )
+        options["deprecated"] = options.get("deprecated") or self.deprecated
+        options["include_in_schema"] = (
+            options.get("include_in_schema", True) and self.include_in_schema
+        )
+
+        self.routes.append(route_class.pending(self.prefix + path, endpoint, **options))
@@ -6,17 +6,26 @@ This module provides the main FastAPI application entry point.
 """
 
 from fastapi import FastAPI, Request
+from fastapi.exception_handlers import (
+    http_exception_handler,
+    request_validation_exception_handler,
+)
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import time
 import uvicorn
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.config import settings
 from app.routers import assessment, email, health, csrf, quiz
-from app.middleware.rate_limiter import rate_limiter
+from app.middleware.rate_limiter import RateLimitExceeded, get_rate_limit_headers
 from app.middleware import request_logger
+from app.middleware.compression import SizedGZipMiddleware
 from app.database import init_db
+from app.services.notification_queue import welcome_email_batcher, welcome_sms_batcher
+from app.services.audit_log import audit_log
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -25,6 +34,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.ENVIRONMENT == "development" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT == "development" else None,
+    default_response_class=ORJSONResponse,
 )
 
 # ============================================================================
@@ -42,8 +52,12 @@ app.add_middleware(
     max_age=86400,  # 24 hours
 )
 
-# GZip compression for responses
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# GZip compression, only where responses are large enough to benefit
+app.add_middleware(
+    SizedGZipMiddleware,
+    path_prefixes=("/api/assessment", "/openapi.json"),
+    minimum_size=4096,
+)
 
 # Request logging middleware
 @app.middleware("http")
@@ -57,53 +71,18 @@ async def log_requests(request: Request, call_next):
     # Calculate duration
     duration = time.time() - start_time
 
-    # Log request (PII-safe)
-    request_logger.log_request(
-        method=request.method,
-        path=request.url.path,
-        status=response.status_code,
-        duration=duration,
-        ip=request.client.host if request.client else "unknown",
+    # Log request (PII-safe) once the response has been handed back
+    asyncio.get_running_loop().call_soon(
+        request_logger.log_request,
+        request.method,
+        request.url.path,
+        response.status_code,
+        duration,
+        request.client.host if request.client else "unknown",
     )
 
     return response
 
-# Rate limiting middleware
-@app.middleware("http")
-async def rate_limit_requests(request: Request, call_next):
-    """Apply rate limiting to protect against abuse."""
-
-    # Check rate limit
-    is_allowed, retry_after = rate_limiter.check_rate_limit(
-        ip=request.client.host if request.client else "unknown",
-        endpoint=request.url.path,
-    )
-
-    if not is_allowed:
-        return JSONResponse(
-            status_code=429,
-            content={
-                "success": False,
-                "error": "Too many requests. Please try again later.",
-                "code": "RATE_LIMIT",
-                "details": {
-                    "retryAfter": retry_after,
-                    "limit": rate_limiter.get_limit(request.url.path),
-                    "window": "15 minutes"
-                }
-            }
-        )
-
-    # Process request
-    response = await call_next(request)
-
-    # Add rate limit headers
-    response.headers["X-RateLimit-Limit"] = str(rate_limiter.get_limit(request.url.path))
-    response.headers["X-RateLimit-Remaining"] = str(rate_limiter.get_remaining(request.client.host, request.url.path))
-    response.headers["X-RateLimit-Reset"] = str(rate_limiter.get_reset_time())
-
-    return response
-
 # ============================================================================
 # EVENT HANDLERS
 # ============================================================================
@@ -111,18 +90,60 @@ async def rate_limit_requests(request: Request, call_next):
 @app.on_event("startup")
 async def startup_event():
     """Initialize database connection and other resources on startup."""
+    request_logger.start_background_logging()
     await init_db()
+    welcome_email_batcher.start()
+    welcome_sms_batcher.start()
+    audit_log.open()
     print(f"🚀 Primary Cell Assessment API started in {settings.ENVIRONMENT} mode")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
+    await welcome_email_batcher.stop()
+    await welcome_sms_batcher.stop()
+    await audit_log.close()
     print("👋 Primary Cell Assessment API shutting down")
+    request_logger.stop_background_logging()
 
 # ============================================================================
 # EXCEPTION HANDLERS
 # ============================================================================
 
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded):
+    """Reject requests that exceeded a route's rate limit."""
+    return JSONResponse(
+        status_code=429,
+        headers={**exc.headers, "Retry-After": str(exc.retry_after)},
+        content={
+            "success": False,
+            "error": "Too many requests. Please try again later.",
+            "code": "RATE_LIMIT",
+            "details": {
+                "retryAfter": exc.retry_after,
+                "limit": exc.limit,
+                "window": f"{exc.window_seconds // 60} minutes"
+            }
+        }
+    )
+
+# Error responses keep the X-RateLimit-* headers a route's limit computed,
+# since headers set on the endpoint's Response are dropped when it raises
+@app.exception_handler(StarletteHTTPException)
+async def rate_limited_http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Return FastAPI's HTTPException response with rate limit headers."""
+    response = await http_exception_handler(request, exc)
+    response.headers.update(get_rate_limit_headers(request))
+    return response
+
+@app.exception_handler(RequestValidationError)
+async def rate_limited_validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Return FastAPI's validation error response with rate limit headers."""
+    response = await request_validation_exception_handler(request, exc)
+    response.headers.update(get_rate_limit_headers(request))
+    return response
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all uncaught exceptions."""
@@ -136,6 +157,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 
     return JSONResponse(
         status_code=500,
+        headers=get_rate_limit_headers(request),
         content={
             "success": False,
             "error": "An unexpected error occurred. Please try again.",
@@ -173,9 +195,14 @@ async def root():
 # ============================================================================
 
 if __name__ == "__main__":
+    development = settings.ENVIRONMENT == "development"
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.ENVIRONMENT == "development",
+        reload=development,
+        # uvloop is unreliable under the reloader, so dev keeps the default loop
+        loop="auto" if development else "uvloop",
+        http="httptools",
     )
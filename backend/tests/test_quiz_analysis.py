@@ -0,0 +1,131 @@
+"""
+Quiz condition analysis tests
+Pins the qualification routing served by /api/quiz/analyze-conditions
+"""
+
+from typing import List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+TREATABLE = ["chronic_back_pain", "sciatica_constant"]
+NON_TREATABLE = ["fibromyalgia", "autoimmune_diseases"]
+
+QUALIFIED = {
+    "qualification_status": "qualified",
+    "should_show_primary_cell": True,
+    "should_show_alternative_primary_cell": False,
+    "requires_manual_review": False,
+    "disqualification_reason": None,
+}
+
+MANUAL_REVIEW = {
+    "qualification_status": "manual_review",
+    "should_show_primary_cell": False,
+    "should_show_alternative_primary_cell": True,
+    "requires_manual_review": True,
+    "disqualification_reason": None,
+}
+
+DISQUALIFIED_NON_TREATABLE = {
+    "qualification_status": "disqualified_non_treatable",
+    "should_show_primary_cell": False,
+    "should_show_alternative_primary_cell": False,
+    "requires_manual_review": False,
+    "disqualification_reason": "non_treatable_only",
+}
+
+
+def analyze(conditions: List[str], condition_other: Optional[str] = None) -> dict:
+    """Post a selection to the endpoint and return the decoded analysis."""
+    body = {"conditions": conditions}
+    if condition_other is not None:
+        body["condition_other"] = condition_other
+
+    response = client.post("/api/quiz/analyze-conditions", json=body)
+    assert response.status_code == 200
+
+    analysis = response.json()
+    # Condition order is not part of the contract
+    analysis["treatable_conditions"] = sorted(analysis["treatable_conditions"])
+    analysis["non_treatable_conditions"] = sorted(analysis["non_treatable_conditions"])
+    return analysis
+
+
+# ============================================================================
+# ROUTING CASES
+# ============================================================================
+
+@pytest.mark.parametrize(
+    "conditions, condition_other, expected, treatable, non_treatable",
+    [
+        # No other, no known conditions
+        ([], None, MANUAL_REVIEW, [], []),
+        # Non-treatable only
+        (NON_TREATABLE, None, DISQUALIFIED_NON_TREATABLE, [], NON_TREATABLE),
+        # Treatable only
+        (TREATABLE, None, QUALIFIED, TREATABLE, []),
+        # Treatable and non-treatable
+        (TREATABLE + NON_TREATABLE, None, QUALIFIED, TREATABLE, NON_TREATABLE),
+        # Other only
+        ([], "knee pain", MANUAL_REVIEW, [], []),
+        # Other and non-treatable
+        (NON_TREATABLE, "knee pain", MANUAL_REVIEW, [], NON_TREATABLE),
+        # Other and treatable
+        (TREATABLE, "knee pain", MANUAL_REVIEW, TREATABLE, []),
+        # Other, treatable and non-treatable
+        (TREATABLE + NON_TREATABLE, "knee pain", MANUAL_REVIEW, TREATABLE, NON_TREATABLE),
+    ],
+)
+def test_routing_cases(conditions, condition_other, expected, treatable, non_treatable):
+    assert analyze(conditions, condition_other) == {
+        **expected,
+        "treatable_conditions": sorted(treatable),
+        "non_treatable_conditions": sorted(non_treatable),
+    }
+
+
+# ============================================================================
+# INPUT HANDLING
+# ============================================================================
+
+def test_unknown_conditions_are_ignored():
+    analysis = analyze(["not_a_condition", "chronic_back_pain", "also_unknown"])
+
+    assert analysis == {
+        **QUALIFIED,
+        "treatable_conditions": ["chronic_back_pain"],
+        "non_treatable_conditions": [],
+    }
+
+
+def test_only_unknown_conditions_fall_back_to_manual_review():
+    assert analyze(["not_a_condition"]) == {
+        **MANUAL_REVIEW,
+        "treatable_conditions": [],
+        "non_treatable_conditions": [],
+    }
+
+
+def test_duplicate_conditions_are_reported_once():
+    analysis = analyze(["fibromyalgia", "fibromyalgia"])
+
+    assert analysis["non_treatable_conditions"] == ["fibromyalgia"]
+
+
+@pytest.mark.parametrize("condition_other", ["", "   ", "\t\n"])
+def test_blank_condition_other_is_not_other(condition_other):
+    assert analyze(TREATABLE, condition_other) == {
+        **QUALIFIED,
+        "treatable_conditions": sorted(TREATABLE),
+        "non_treatable_conditions": [],
+    }
+
+
+def test_condition_other_with_text_requires_manual_review():
+    assert analyze(TREATABLE, "  knee pain  ")["qualification_status"] == "manual_review"
+